@@ -12,8 +12,14 @@ from type_bridge import Credentials, Database, TypeDB
 # Container tool selection (docker|podman or explicit binary)
 CONTAINER_TOOL = os.getenv("CONTAINER_TOOL", "docker")
 
+# Keep TypeDB data on tmpfs for faster, non-durable test runs (opt-in)
+USE_INMEMORY = os.getenv("TYPE_BRIDGE_TEST_INMEMORY", "0").lower() in ("1", "true")
+
 # Test database configuration
-TEST_DB_NAME = "type_bridge_test"
+# Each pytest-xdist worker gets its own database so parallel workers don't wipe each other
+TEST_DB_NAME = "type_bridge_test" + (
+    f"_{os.environ['PYTEST_XDIST_WORKER']}" if "PYTEST_XDIST_WORKER" in os.environ else ""
+)
 # Allow overriding port/address via environment (for local conflicts or Podman/Docker remaps)
 TEST_DB_ADDRESS = os.getenv("TYPEDB_ADDRESS", "localhost:1730")
 
@@ -40,9 +46,24 @@ def docker_typedb():
         yield
         return
 
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # Every worker would run compose down/up on the shared typedb_test container
+        pytest.fail(
+            "Parallel integration runs share one TypeDB container: start it once "
+            "(e.g. `docker compose up -d`) and run with USE_DOCKER=false"
+        )
+
     # Get project root directory
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 
+    if USE_INMEMORY:
+        compose_base += [
+            "-f",
+            "docker-compose.yml",
+            "-f",
+            "docker-compose.inmemory.yml",
+        ]
+
     # Start Docker container
     try:
         # Stop any existing container
@@ -175,6 +196,31 @@ def clean_db(typedb_driver, test_database):
     database.close()
 
 
+@pytest.fixture(scope="module")
+def clean_db_module(typedb_driver, test_database):
+    """Provide a clean database shared by all tests in a module.
+
+    Module-scoped counterpart of ``clean_db`` for read-only test modules that
+    build their schema and dataset once and only query it afterwards.
+
+    Args:
+        typedb_driver: TypeDB driver fixture
+        test_database: Test database name
+
+    Yields:
+        Database instance with clean state
+    """
+    # Delete and recreate database for clean state
+    if typedb_driver.databases.contains(test_database):
+        typedb_driver.databases.get(test_database).delete()
+    typedb_driver.databases.create(test_database)
+
+    database = Database(address=TEST_DB_ADDRESS, database=test_database)
+    database.connect()
+    yield database
+    database.close()
+
+
 @pytest.fixture(scope="function")
 def db_with_schema(clean_db):
     """Provide a database with a basic schema already defined.
@@ -4,7 +4,11 @@ Tests the new type-safe syntax for filtering role player attributes:
     Employment.manager(db).filter(Employment.employee.age.gt(Age(30)))
 """
 
+import operator
+from typing import cast
+
 import pytest
+from typedb.driver import TransactionType
 
 from type_bridge import (
     Entity,
@@ -17,6 +21,11 @@ from type_bridge import (
     String,
     TypeFlags,
 )
+from type_bridge.fields.role import RolePlayerStringFieldRef
+
+# Tests here are independent reads of one shared dataset; keep them on a single
+# xdist worker so they share the module-scoped fixture.
+pytestmark = pytest.mark.xdist_group("role_field_expressions")
 
 
 class Name(String):
@@ -64,16 +73,44 @@ class Employment(Relation):
     salary: Salary | None = None
 
 
-@pytest.fixture
-def setup_employment_data(clean_db):
-    """Setup test data for employment relations."""
-    schema_manager = SchemaManager(clean_db)
-    schema_manager.register(Person, Company, Employment)
-    schema_manager.sync_schema(force=True)
+# Shared attribute values used by the filter predicates below
+AGE_25 = Age(25)
+AGE_30 = Age(30)
+AGE_35 = Age(35)
+NAME_TECH = Name("Tech")
+CITY_Y = City("Y")
+
+# Filter expressions are immutable value objects, so build each predicate once
+# and reuse it across tests.
+EMP_AGE_GT_25 = Employment.employee.age.gt(AGE_25)
+EMP_AGE_LT_35 = Employment.employee.age.lt(AGE_35)
+EMP_AGE_GTE_25 = Employment.employee.age.gte(AGE_25)
+EMP_AGE_GTE_30 = Employment.employee.age.gte(AGE_30)
+EMP_AGE_LTE_30 = Employment.employee.age.lte(AGE_30)
+EMP_AGE_EQ_30 = Employment.employee.age.eq(AGE_30)
+EMP_AGE_NEQ_30 = Employment.employee.age.neq(AGE_30)
+EMPLOYER_NAME_CONTAINS_TECH = cast(
+    RolePlayerStringFieldRef[Name], Employment.employer.name
+).contains(NAME_TECH)
+EMP_CITY_CONTAINS_Y = cast(RolePlayerStringFieldRef[City], Employment.employee.city).contains(
+    CITY_Y
+)
+
+# Projection used by assertions: result -> employee name string
+GET_EMPLOYEE_NAME = operator.attrgetter("employee.name.value")
 
-    person_manager = Person.manager(clean_db)
-    company_manager = Company.manager(clean_db)
-    employment_manager = Employment.manager(clean_db)
+
+@pytest.fixture(scope="module")
+def _employment_dataset(clean_db_module):
+    """Build the schema and employment dataset once for the whole module.
+
+    Every test in this module only reads from the dataset, so it is safe to
+    share it instead of rebuilding it per test.
+    """
+    schema_manager = SchemaManager(clean_db_module)
+    schema_manager.register(Person, Company, Employment)
+    # clean_db_module hands us a freshly created database, so no forced recreate is needed
+    schema_manager.sync_schema()
 
     # Create persons with different ages and cities
     alice = Person(name=Name("Alice"), age=Age(30), city=City("NYC"))
@@ -84,9 +121,6 @@ def setup_employment_data(clean_db):
     techcorp = Company(name=Name("TechCorp"), industry=Industry("Technology"))
     finco = Company(name=Name("FinCo"), industry=Industry("Finance"))
 
-    person_manager.insert_many([alice, bob, charlie])
-    company_manager.insert_many([techcorp, finco])
-
     # Create employment relations
     employments = [
         Employment(
@@ -108,143 +142,86 @@ def setup_employment_data(clean_db):
             salary=Salary(90000),
         ),
     ]
-    employment_manager.insert_many(employments)
+
+    # Insert everything in a single write transaction (one commit)
+    with clean_db_module.transaction(TransactionType.WRITE) as tx:
+        Person.manager(tx).insert_many([alice, bob, charlie])
+        Company.manager(tx).insert_many([techcorp, finco])
+        Employment.manager(tx).insert_many(employments)
 
     return {
-        "db": clean_db,
+        "db": clean_db_module,
         "alice": alice,
         "bob": bob,
         "charlie": charlie,
         "techcorp": techcorp,
         "finco": finco,
+        "manager": Employment.manager(clean_db_module),
+        "person_manager": Person.manager(clean_db_module),
+        "company_manager": Company.manager(clean_db_module),
     }
 
 
-class TestRoleFieldExpressionComparisons:
-    """Tests for type-safe comparison expressions on role-player fields."""
-
-    @pytest.mark.integration
-    @pytest.mark.order(300)
-    def test_gt_filter(self, setup_employment_data):
-        """Filter by role-player attribute greater than value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
-
-        # Find employments where employee age > 25
-        results = manager.filter(Employment.employee.age.gt(Age(25))).execute()
-
-        assert len(results) == 2
-        names = {r.employee.name.value for r in results}
-        assert names == {"Alice", "Charlie"}
-
-    @pytest.mark.integration
-    @pytest.mark.order(301)
-    def test_lt_filter(self, setup_employment_data):
-        """Filter by role-player attribute less than value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
-
-        # Find employments where employee age < 35
-        results = manager.filter(Employment.employee.age.lt(Age(35))).execute()
-
-        assert len(results) == 2
-        names = {r.employee.name.value for r in results}
-        assert names == {"Alice", "Bob"}
-
-    @pytest.mark.integration
-    @pytest.mark.order(302)
-    def test_gte_filter(self, setup_employment_data):
-        """Filter by role-player attribute greater than or equal value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
-
-        # Find employments where employee age >= 30
-        results = manager.filter(Employment.employee.age.gte(Age(30))).execute()
-
-        assert len(results) == 2
-        names = {r.employee.name.value for r in results}
-        assert names == {"Alice", "Charlie"}
-
-    @pytest.mark.integration
-    @pytest.mark.order(303)
-    def test_lte_filter(self, setup_employment_data):
-        """Filter by role-player attribute less than or equal value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
-
-        # Find employments where employee age <= 30
-        results = manager.filter(Employment.employee.age.lte(Age(30))).execute()
-
-        assert len(results) == 2
-        names = {r.employee.name.value for r in results}
-        assert names == {"Alice", "Bob"}
-
-    @pytest.mark.integration
-    @pytest.mark.order(304)
-    def test_eq_filter(self, setup_employment_data):
-        """Filter by role-player attribute equals value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+@pytest.fixture
+def setup_employment_data(_employment_dataset):
+    """Setup test data for employment relations (shared, read-only)."""
+    return _employment_dataset
 
-        # Find employments where employee age == 30
-        results = manager.filter(Employment.employee.age.eq(Age(30))).execute()
 
-        assert len(results) == 1
-        assert results[0].employee.name.value == "Alice"
+class TestRoleFieldExpressionComparisons:
+    """Tests for type-safe comparison expressions on role-player fields."""
 
     @pytest.mark.integration
-    @pytest.mark.order(305)
-    def test_neq_filter(self, setup_employment_data):
-        """Filter by role-player attribute not equals value."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
-
-        # Find employments where employee age != 30
-        results = manager.filter(Employment.employee.age.neq(Age(30))).execute()
-
-        assert len(results) == 2
-        names = {r.employee.name.value for r in results}
-        assert names == {"Bob", "Charlie"}
+    @pytest.mark.parametrize(
+        ("expr", "expected_names"),
+        [
+            pytest.param(EMP_AGE_GT_25, {"Alice", "Charlie"}, id="gt"),
+            pytest.param(EMP_AGE_LT_35, {"Alice", "Bob"}, id="lt"),
+            pytest.param(EMP_AGE_GTE_30, {"Alice", "Charlie"}, id="gte"),
+            pytest.param(EMP_AGE_LTE_30, {"Alice", "Bob"}, id="lte"),
+            pytest.param(EMP_AGE_EQ_30, {"Alice"}, id="eq"),
+            pytest.param(EMP_AGE_NEQ_30, {"Bob", "Charlie"}, id="neq"),
+        ],
+    )
+    def test_scalar_comparison(self, setup_employment_data, expr, expected_names):
+        """Filter by role-player attribute compared against a value."""
+        manager = setup_employment_data["manager"]
+
+        results = manager.filter(expr).execute()
+
+        assert len(results) == len(expected_names)
+        names = set(map(GET_EMPLOYEE_NAME, results))
+        assert names == expected_names
 
 
 class TestRoleFieldExpressionStringMethods:
     """Tests for string-specific methods on role-player fields."""
 
     @pytest.mark.integration
-    @pytest.mark.order(310)
     def test_contains_filter(self, setup_employment_data):
         """Filter by role-player string attribute contains."""
-        from type_bridge.fields.role import RolePlayerStringFieldRef
-
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Find employments where employer name contains "Tech"
-        employer_name_ref = Employment.employer.name
-        assert isinstance(employer_name_ref, RolePlayerStringFieldRef)
-        results = manager.filter(employer_name_ref.contains(Name("Tech"))).execute()
+        assert isinstance(Employment.employer.name, RolePlayerStringFieldRef)
+        results = manager.filter(EMPLOYER_NAME_CONTAINS_TECH).execute()
 
         assert len(results) == 2
         # Both Alice and Bob work at TechCorp
-        names = {r.employee.name.value for r in results}
+        names = set(map(GET_EMPLOYEE_NAME, results))
         assert names == {"Alice", "Bob"}
 
     @pytest.mark.integration
-    @pytest.mark.order(311)
     def test_like_filter(self, setup_employment_data):
         """Filter by role-player string attribute like pattern."""
-        from type_bridge.fields.role import RolePlayerStringFieldRef
-
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Find employments where employee city contains "Y" (NYC)
-        employee_city_ref = Employment.employee.city
-        assert isinstance(employee_city_ref, RolePlayerStringFieldRef)
-        results = manager.filter(employee_city_ref.contains(City("Y"))).execute()
+        assert isinstance(Employment.employee.city, RolePlayerStringFieldRef)
+        results = manager.filter(EMP_CITY_CONTAINS_Y).execute()
 
         assert len(results) == 2
-        names = {r.employee.name.value for r in results}
+        names = set(map(GET_EMPLOYEE_NAME, results))
         assert names == {"Alice", "Charlie"}
 
 
@@ -252,55 +229,40 @@ class TestCombinedExpressions:
     """Tests for combining type-safe expressions with other filters."""
 
     @pytest.mark.integration
-    @pytest.mark.order(320)
     def test_combine_with_relation_attribute(self, setup_employment_data):
         """Combine role-player expression with relation's own attribute."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Find employments where employee age > 25 AND salary > 85000
         # Use manager.filter() for kwargs, then chain expressions
-        results = manager.filter(Employment.employee.age.gt(Age(25)), salary__gt=85000).execute()
+        results = manager.filter(EMP_AGE_GT_25, salary__gt=85000).execute()
 
         assert len(results) == 2
-        names = {r.employee.name.value for r in results}
+        names = set(map(GET_EMPLOYEE_NAME, results))
         assert names == {"Alice", "Charlie"}
 
     @pytest.mark.integration
-    @pytest.mark.order(321)
     def test_combine_with_django_style_lookup(self, setup_employment_data):
         """Combine type-safe expression with Django-style lookup."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Type-safe expression + Django-style lookup in same filter call
-        results = manager.filter(
-            Employment.employee.age.gt(Age(25)), employer__industry__eq="Technology"
-        ).execute()
+        results = manager.filter(EMP_AGE_GT_25, employer__industry__eq="Technology").execute()
 
         assert len(results) == 1
         assert results[0].employee.name.value == "Alice"
 
     @pytest.mark.integration
-    @pytest.mark.order(322)
     def test_multiple_role_field_expressions(self, setup_employment_data):
         """Combine multiple type-safe role field expressions."""
-        from type_bridge.fields.role import RolePlayerStringFieldRef
-
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Filter on both employee and employer attributes
-        employer_name_ref = Employment.employer.name
-        assert isinstance(employer_name_ref, RolePlayerStringFieldRef)
-        results = (
-            manager.filter(Employment.employee.age.gte(Age(25)))
-            .filter(employer_name_ref.contains(Name("Tech")))
-            .execute()
-        )
+        assert isinstance(Employment.employer.name, RolePlayerStringFieldRef)
+        results = manager.filter(EMP_AGE_GTE_25).filter(EMPLOYER_NAME_CONTAINS_TECH).execute()
 
         assert len(results) == 2
-        names = {r.employee.name.value for r in results}
+        names = set(map(GET_EMPLOYEE_NAME, results))
         assert names == {"Alice", "Bob"}
 
 
@@ -308,11 +270,9 @@ class TestCombinedWithPagination:
     """Tests for combining type-safe expressions with sorting and pagination."""
 
     @pytest.mark.integration
-    @pytest.mark.order(323)
     def test_combined_with_order_by_and_limit(self, setup_employment_data):
         """Combine type-safe expression + Django-style + order_by + limit + offset."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Full combined query:
         # - Type-safe expression: Employment.employee.age.gte(Age(25))
@@ -320,7 +280,7 @@ class TestCombinedWithPagination:
         # - Order by role-player attribute and relation attribute
         # - Pagination with limit and offset
         results = (
-            manager.filter(Employment.employee.age.gte(Age(25)), salary__gte=80000)
+            manager.filter(EMP_AGE_GTE_25, salary__gte=80000)
             .order_by("employee__age", "-salary")
             .limit(10)
             .offset(0)
@@ -337,15 +297,13 @@ class TestCombinedWithPagination:
         assert results[2].employee.name.value == "Charlie"
 
     @pytest.mark.integration
-    @pytest.mark.order(324)
     def test_chained_filter_with_pagination(self, setup_employment_data):
         """Chain multiple filter() calls with Django-style + pagination."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Chained filters with Django-style in second filter call
         results = (
-            manager.filter(Employment.employee.age.gte(Age(25)))
+            manager.filter(EMP_AGE_GTE_25)
             .filter(employer__industry__eq="Technology")
             .order_by("-salary")
             .limit(1)
@@ -363,33 +321,70 @@ class TestBackwardCompatibilityWithDjangoStyle:
     """Tests verifying Django-style lookups still work alongside type-safe expressions."""
 
     @pytest.mark.integration
-    @pytest.mark.order(330)
     def test_django_style_still_works(self, setup_employment_data):
         """Django-style lookups should continue to work."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Old Django-style syntax
         results = manager.filter(employee__age__gt=25).execute()
 
         assert len(results) == 2
-        names = {r.employee.name.value for r in results}
+        names = set(map(GET_EMPLOYEE_NAME, results))
         assert names == {"Alice", "Charlie"}
 
     @pytest.mark.integration
-    @pytest.mark.order(331)
     def test_equivalent_results(self, setup_employment_data):
         """Type-safe and Django-style should produce equivalent results."""
-        db = setup_employment_data["db"]
-        manager = Employment.manager(db)
+        manager = setup_employment_data["manager"]
 
         # Type-safe
-        results1 = manager.filter(Employment.employee.age.gt(Age(25))).execute()
+        results1 = manager.filter(EMP_AGE_GT_25).execute()
 
         # Django-style
         results2 = manager.filter(employee__age__gt=25).execute()
 
         # Should have same results
-        names1 = {r.employee.name.value for r in results1}
-        names2 = {r.employee.name.value for r in results2}
+        names1 = set(map(GET_EMPLOYEE_NAME, results1))
+        names2 = set(map(GET_EMPLOYEE_NAME, results2))
         assert names1 == names2
+
+
+class TestPredicatePushdown:
+    """Tests guarding that role-player filters are pushed into the TypeQL match clause."""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        ("expressions", "filters", "expected_pattern"),
+        [
+            pytest.param((EMP_AGE_GT_25,), {}, "$employee_age > 25", id="type-safe"),
+            pytest.param((), {"employee__age__gt": 25}, "$employee_age > 25", id="django-style"),
+            pytest.param(
+                (EMPLOYER_NAME_CONTAINS_TECH,),
+                {},
+                '$employer_name contains "Tech"',
+                id="string-contains",
+            ),
+        ],
+    )
+    def test_filter_is_emitted_in_match_clause(
+        self, setup_employment_data, monkeypatch, expressions, filters, expected_pattern
+    ):
+        """Filters must appear in the emitted match clause, not be applied client-side."""
+        from type_bridge.crud.relation.query import RelationQuery
+
+        captured: list[str] = []
+        original_execute = RelationQuery._execute
+
+        def spy_execute(self, query, tx_type):
+            captured.append(query)
+            return original_execute(self, query, tx_type)
+
+        monkeypatch.setattr(RelationQuery, "_execute", spy_execute)
+
+        manager = setup_employment_data["manager"]
+        results = manager.filter(*expressions, **filters).execute()
+
+        # First emitted query is the fetch; the predicate must be part of its match clause
+        match_clause = captured[0].split("fetch", 1)[0]
+        assert expected_pattern in match_clause
+        assert len(results) == 2
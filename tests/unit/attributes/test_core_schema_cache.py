@@ -0,0 +1,100 @@
+"""Test caching of Pydantic schema functions for attribute types."""
+
+from typing import Annotated, Literal
+
+import pytest
+from pydantic import BaseModel, PlainSerializer, TypeAdapter, WithJsonSchema
+from pydantic.errors import PydanticInvalidForJsonSchema
+
+from type_bridge import Entity, Flag, Integer, Key, String, TypeFlags
+from type_bridge.attribute.base import _schema_function_cache
+
+
+def test_schema_functions_bound_once_per_attribute_class():
+    """Test that reusing an attribute across models reuses its bound functions."""
+
+    class Name(String):
+        pass
+
+    class Age(Integer):
+        pass
+
+    class Person(Entity):
+        flags = TypeFlags(name="person")
+        name: Name = Flag(Key)
+        age: Age | None = None
+
+    functions = _schema_function_cache[(Name, False)]
+
+    class Company(Entity):
+        flags = TypeFlags(name="company")
+        name: Name = Flag(Key)
+
+    assert _schema_function_cache[(Name, False)] is functions
+    assert (Age, False) in _schema_function_cache
+
+    # Models built from the cached schemas still validate
+    assert Person(name=Name("Alice"), age=Age(30)).age == Age(30)
+    assert Company(name=Name("Acme")).name == Name("Acme")
+
+
+def test_literal_source_types_share_bound_functions():
+    """Test that all Literal annotations of a class share one validator/serializer pair."""
+
+    class Status(String):
+        pass
+
+    active = TypeAdapter(Annotated[Literal["active"], Status])
+    closed = TypeAdapter(Annotated[Literal["closed", "active"], Status])
+    plain = TypeAdapter(Status)
+
+    # One pair for the Literal annotations, one for the plain annotation
+    assert [key for key in _schema_function_cache if key[0] is Status] == [
+        (Status, True),
+        (Status, False),
+    ]
+
+    # The Literal schemas unwrap attribute instances; the plain schema wraps raw values
+    assert active.validate_python(Status("active")) == "active"
+    assert closed.validate_python(Status("closed")) == "closed"
+    assert plain.validate_python("active") == Status("active")
+    assert plain.dump_python(Status("active")) == "active"
+
+
+def test_literal_detection_cached_per_annotation():
+    """Test that Literal detection results are cached per source type."""
+    from type_bridge.attribute.base import _is_literal_source, _literal_source_cache
+
+    class Code(String):
+        pass
+
+    assert _is_literal_source(Code) is False
+    assert _literal_source_cache[Code] is False
+    assert _is_literal_source(Literal["a", "b"]) is True
+    assert _literal_source_cache[Literal["a", "b"]] is True
+
+
+def test_annotated_field_customization_does_not_leak():
+    """Test that Annotated metadata on one field doesn't change other fields' schemas."""
+
+    class Name(String):
+        pass
+
+    class Redacted(BaseModel):
+        name: Annotated[Name, PlainSerializer(lambda v: "REDACTED", return_type=str)]
+
+    class Plain(BaseModel):
+        name: Name
+
+    class Custom(BaseModel):
+        name: Annotated[Name, WithJsonSchema({"type": "integer"})]
+
+    class Other(BaseModel):
+        name: Name
+
+    assert Redacted(name=Name("Alice")).model_dump() == {"name": "REDACTED"}
+    assert Plain(name=Name("Bob")).model_dump() == {"name": "Bob"}
+    assert Custom.model_json_schema()["properties"]["name"]["type"] == "integer"
+    # Without the override, plain attribute fields have no JSON schema
+    with pytest.raises(PydanticInvalidForJsonSchema):
+        Other.model_json_schema()
@@ -139,3 +139,13 @@ def test_integer_string_representation():
     # Test __repr__
     assert "Age" in repr(age)
     assert "30" in repr(age)
+
+
+def test_integer_class_getitem_returns_class():
+    """Test that subscription is an identity for type-checking annotations."""
+
+    class Age(Integer):
+        pass
+
+    assert Integer[int] is Integer
+    assert Age[int] is Age
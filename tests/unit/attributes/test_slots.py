@@ -0,0 +1,44 @@
+"""Test slotted storage of attribute instances and flag objects."""
+
+import pytest
+
+from type_bridge import AttributeFlags, Card, Flag, Integer, Key, String, TypeFlags
+
+
+def test_attribute_subclass_with_empty_slots_has_no_dict():
+    """Test that attribute subclasses declaring empty __slots__ store only the value."""
+
+    class Name(String):
+        __slots__ = ()
+
+    name = Name("Alice")
+    assert name.value == "Alice"
+    assert not hasattr(name, "__dict__")
+    with pytest.raises(AttributeError):
+        name.extra = 1  # type: ignore[attr-defined]
+
+
+def test_attribute_subclass_without_slots_still_works():
+    """Test that plain subclasses keep working (they get a __dict__ from Python)."""
+
+    class Age(Integer):
+        pass
+
+    age = Age(30)
+    assert age.value == 30
+    assert age == Age(30)
+    assert hash(age) == hash(Age(30))
+
+
+def test_flag_objects_are_slotted():
+    """Test that Card, AttributeFlags, and TypeFlags instances have no __dict__."""
+    card = Card(1, 5)
+    flags = Flag(Key)
+    type_flags = TypeFlags(name="person")
+
+    assert (card.min, card.max) == (1, 5)
+    assert isinstance(flags, AttributeFlags)
+    assert flags.is_key is True
+    assert type_flags.name == "person"
+    for obj in (card, flags, type_flags):
+        assert not hasattr(obj, "__dict__")
@@ -238,3 +238,24 @@ def test_string_with_newlines():
 
     assert "$e isa doc" in query
     assert "has Description" in query
+
+
+def test_string_validator_keeps_subclass_instances():
+    """Test that validation passes subclass instances through and wraps raw values."""
+
+    class Name(String):
+        pass
+
+    class Nickname(Name):
+        pass
+
+    class Person(Entity):
+        flags = TypeFlags(name="person")
+        name: Name = Flag(Key)
+
+    nick = Nickname("Al")
+    assert Person(name=nick).name is nick
+
+    raw = Person.model_validate({"name": "Alice"}).name
+    assert type(raw) is Name
+    assert raw.value == "Alice"
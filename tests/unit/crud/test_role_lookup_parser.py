@@ -5,6 +5,8 @@ import pytest
 from type_bridge import Entity, Flag, Integer, Key, Relation, Role, String, TypeFlags
 from type_bridge.crud.relation.lookup import (
     _build_lookup_expression,
+    _resolve_role_player_attribute,
+    _role_attribute_cache,
     parse_role_lookup_filters,
 )
 from type_bridge.expressions import (
@@ -410,6 +412,33 @@ def test_too_many_parts_raises():
         parse_role_lookup_filters(Employment, {"employee__age__gt__extra": 30})
 
 
+# ============================================================
+# _resolve_role_player_attribute tests
+# ============================================================
+
+
+def test_resolve_role_player_attribute_is_cached():
+    """Test role-player attribute resolution is cached per relation, role and field."""
+    _role_attribute_cache.pop((Employment, "employee", "age"), None)
+
+    assert _resolve_role_player_attribute(Employment, "employee", "age") is Age
+    assert _role_attribute_cache[(Employment, "employee", "age")] is Age
+
+    # Repeated lookups reuse the cached type and produce identical expressions
+    first = parse_role_lookup_filters(Employment, {"employee__age__gt": 30})[2]["employee"][0]
+    second = parse_role_lookup_filters(Employment, {"employee__age__gt": 40})[2]["employee"][0]
+    assert isinstance(first.inner_expr, ComparisonExpr)
+    assert isinstance(second.inner_expr, ComparisonExpr)
+    assert first.inner_expr.attr_type is second.inner_expr.attr_type is Age
+
+
+def test_resolve_role_player_attribute_unknown_field_not_cached():
+    """Test failed resolutions raise and are not cached."""
+    with pytest.raises(ValueError, match="do not have attribute"):
+        _resolve_role_player_attribute(Employment, "employee", "salary")
+    assert (Employment, "employee", "salary") not in _role_attribute_cache
+
+
 # ============================================================
 # _build_lookup_expression tests
 # ============================================================
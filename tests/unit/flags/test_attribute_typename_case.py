@@ -233,3 +233,18 @@ def test_attribute_explicit_name_validation():
 
     schema = Name.to_schema_definition()
     assert "attribute custom_name" in schema
+
+
+def test_builtin_attribute_name_computed_on_first_use():
+    """Test that built-in attribute types resolve their name lazily."""
+    from type_bridge import Decimal
+
+    assert Decimal.get_attribute_name() == "Decimal"
+    assert Decimal.__dict__["_attr_name"] == "Decimal"
+
+    class Price(Decimal):
+        pass
+
+    # User subclasses get their own name eagerly, never the parent's
+    assert Price.__dict__["_attr_name"] == "Price"
+    assert Price.get_attribute_name() == "Price"
@@ -0,0 +1,119 @@
+"""Tests for the Flag() factory and shared flag instances."""
+
+from type_bridge import AttributeFlags, Card, Entity, Flag, Key, String, TypeFlags, Unique
+
+
+class Name(String):
+    pass
+
+
+class Email(String):
+    pass
+
+
+def test_common_marker_combinations_are_shared():
+    """Flag(Key), Flag(Unique) and Flag(Key, Unique) return shared instances."""
+    assert Flag(Key) is Flag(Key)
+    assert Flag(Unique) is Flag(Unique)
+    assert Flag(Key, Unique) is Flag(Unique, Key)
+
+    key = Flag(Key)
+    assert (key.is_key, key.is_unique, key.card_min, key.card_max) == (True, False, 1, 1)
+    unique = Flag(Unique)
+    assert (unique.is_unique, unique.card_min, unique.card_max) == (True, None, None)
+    both = Flag(Key, Unique)
+    assert (both.is_key, both.is_unique, both.card_min, both.card_max) == (True, True, 1, 1)
+
+
+def test_card_produces_fresh_flags():
+    """Flags including a Card are built per call."""
+    first = Flag(Key, Card(min=1))
+    second = Flag(Key, Card(min=1))
+    assert first is not second
+    assert first == second
+    assert (first.is_key, first.card_min, first.card_max) == (True, 1, None)
+    assert first.has_explicit_card is True
+
+
+def test_model_merge_does_not_mutate_shared_flags():
+    """Merging annotation cardinality into Flag(Unique) leaves the shared instance intact."""
+
+    class Person(Entity):
+        flags = TypeFlags(name="person")
+        name: Name = Flag(Key)
+        email: Email | None = Flag(Unique)
+
+    class Account(Entity):
+        flags = TypeFlags(name="account")
+        email: Email = Flag(Unique)
+
+    person_email = Person.get_owned_attributes()["email"].flags
+    account_email = Account.get_owned_attributes()["email"].flags
+
+    assert (person_email.card_min, person_email.card_max) == (0, 1)
+    assert (account_email.card_min, account_email.card_max) == (1, 1)
+    assert (Flag(Unique).card_min, Flag(Unique).card_max) == (None, None)
+
+
+def test_attribute_flags_are_frozen():
+    """AttributeFlags can't be modified after creation."""
+    import dataclasses
+
+    import pytest
+
+    flags = Flag(Key)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        flags.is_unique = True  # type: ignore[misc]
+    assert dataclasses.replace(flags, is_unique=True).is_unique is True
+    assert flags.is_unique is False
+
+
+def test_card_argument_forms():
+    """Card supports positional, keyword, and mixed forms."""
+    import pytest
+
+    assert (Card(1, 5).min, Card(1, 5).max) == (1, 5)
+    assert (Card(2).min, Card(2).max) == (2, None)
+    assert (Card(2, max=4).min, Card(2, max=4).max) == (2, 4)
+    assert (Card(min=2).min, Card(min=2).max) == (2, None)
+    assert (Card(max=5).min, Card(max=5).max) == (0, 5)
+    assert (Card().min, Card().max) == (None, None)
+    with pytest.raises(ValueError, match="at most 2 positional"):
+        Card(1, 2, 3)
+
+
+def test_annotations_cached_per_flag_combination():
+    """Annotations are cached per flag combination without adding dataclass fields."""
+    import dataclasses
+
+    flags = Flag(Card(0, 3))
+    assert flags.to_typeql_annotations() == ["@card(0..3)"]
+
+    derived = dataclasses.replace(flags, is_unique=True)
+    assert derived.to_typeql_annotations() == ["@unique", "@card(0..3)"]
+    assert "_annotations" not in {f.name for f in dataclasses.fields(AttributeFlags)}
+    assert "_annotations" not in dataclasses.asdict(Flag(Key))
+
+
+def test_annotation_only_fields_share_flags():
+    """Fields with the same annotation metadata share one AttributeFlags instance."""
+
+    class Title(String):
+        pass
+
+    class Book(Entity):
+        flags = TypeFlags(name="book")
+        title: Title
+        subtitle: Name | None = None
+
+    class Article(Entity):
+        flags = TypeFlags(name="article")
+        title: Title
+        summary: Email | None = None
+
+    book_attrs = Book.get_owned_attributes()
+    article_attrs = Article.get_owned_attributes()
+
+    assert book_attrs["title"].flags is article_attrs["title"].flags
+    assert book_attrs["subtitle"].flags is article_attrs["summary"].flags
+    assert (book_attrs["subtitle"].flags.card_min, book_attrs["subtitle"].flags.card_max) == (0, 1)
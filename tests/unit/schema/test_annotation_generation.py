@@ -222,3 +222,52 @@ class TestIndependentAnnotationGeneration:
 
         assert IndependentAttr.is_independent() is True
         assert DependentAttr.is_independent() is False
+
+
+class TestSchemaDefinitionCaching:
+    """Test memoization of attribute schema definitions and ownership annotations."""
+
+    def test_schema_definition_built_once_per_class(self) -> None:
+        """Test repeated calls return the cached definition string."""
+
+        class Age(Integer):
+            range_constraint: ClassVar[tuple[str | None, str | None]] = ("0", "150")
+
+        first = Age.to_schema_definition()
+        assert first == "attribute Age, value integer @range(0..150);"
+        assert Age.to_schema_definition() is first
+        assert Age.__dict__["_schema_definition"] is first
+
+    def test_subclass_does_not_reuse_parent_definition(self) -> None:
+        """Test a subclass builds its own definition after the parent was cached."""
+
+        class Name(String):
+            pass
+
+        class FirstName(Name):
+            pass
+
+        assert Name.to_schema_definition() == "attribute Name, value string;"
+        assert FirstName.to_schema_definition() == "attribute FirstName, value string;"
+
+    def test_typeql_annotations_return_fresh_lists(self) -> None:
+        """Test cached annotations can't be mutated through the returned list."""
+        from type_bridge import Card, Flag
+
+        flags = Flag(Card(1, 5))
+        annotations = flags.to_typeql_annotations()
+        annotations.append("@mutated")
+        assert flags.to_typeql_annotations() == ["@card(1..5)"]
+
+    def test_identical_definitions_share_one_string(self) -> None:
+        """Test classes resolving to the same definition share an interned string."""
+
+        def make_tag() -> type[String]:
+            class Tag(String):
+                pass
+
+            return Tag
+
+        first, second = make_tag(), make_tag()
+        assert first is not second
+        assert first.to_schema_definition() is second.to_schema_definition()
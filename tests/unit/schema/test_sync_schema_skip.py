@@ -0,0 +1,115 @@
+"""Unit tests for SchemaManager.sync_schema skipping an already-applied schema."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from type_bridge import Entity, Flag, Integer, Key, SchemaManager, String, TypeFlags
+from type_bridge.schema import manager as manager_module
+
+
+class Name(String):
+    pass
+
+
+class Age(Integer):
+    pass
+
+
+class Person(Entity):
+    flags = TypeFlags(name="person")
+    name: Name = Flag(Key)
+    age: Age | None = None
+
+
+class PersonWithoutAge(Entity):
+    flags = TypeFlags(name="person")
+    name: Name = Flag(Key)
+
+
+@pytest.fixture
+def mock_db():
+    """Database double with a unique address/name key per test."""
+    db = MagicMock()
+    db.address = "localhost:1729"
+    db.database_name = f"sync_skip_{id(db)}"
+    db.database_exists.return_value = True
+    db.get_schema.return_value = "define entity person;"
+    yield db
+    manager_module._applied_schemas.pop((db.address, db.database_name), None)
+
+
+def _schema_applies(db: MagicMock) -> int:
+    """Count schema transactions opened on the database double."""
+    return sum(1 for call in db.transaction.call_args_list if call.args == ("schema",))
+
+
+def test_second_sync_of_same_schema_is_skipped(mock_db):
+    """Re-syncing an identical schema over an unchanged server schema does not reapply it."""
+    schema_manager = SchemaManager(mock_db)
+    schema_manager.register(Person)
+
+    with patch.object(SchemaManager, "_type_exists", return_value=False):
+        schema_manager.sync_schema()
+    assert _schema_applies(mock_db) == 1
+
+    with patch.object(SchemaManager, "_type_exists", return_value=True):
+        second = SchemaManager(mock_db)
+        second.register(Person)
+        second.sync_schema()
+    assert _schema_applies(mock_db) == 1
+
+
+def test_changed_server_schema_is_not_skipped(mock_db):
+    """A schema changed on the server since the sync (e.g. by a migration) is re-checked."""
+    from type_bridge.schema import SchemaConflictError
+
+    schema_manager = SchemaManager(mock_db)
+    schema_manager.register(Person)
+    with patch.object(SchemaManager, "_type_exists", return_value=False):
+        schema_manager.sync_schema()
+
+    mock_db.get_schema.return_value = "define entity person; entity company;"
+    with patch.object(SchemaManager, "_type_exists", return_value=True):
+        with pytest.raises(SchemaConflictError):
+            schema_manager.sync_schema()
+
+
+def test_sync_reapplies_when_database_is_missing(mock_db):
+    """A recorded schema is reapplied if the database was dropped and recreated empty."""
+    schema_manager = SchemaManager(mock_db)
+    schema_manager.register(Person)
+
+    with patch.object(SchemaManager, "_type_exists", return_value=False):
+        schema_manager.sync_schema()
+        mock_db.get_schema.return_value = ""
+        schema_manager.sync_schema()
+    assert _schema_applies(mock_db) == 2
+
+
+def test_changed_schema_still_detects_conflict(mock_db):
+    """A different schema over existing types still raises SchemaConflictError."""
+    from type_bridge.schema import SchemaConflictError
+
+    schema_manager = SchemaManager(mock_db)
+    schema_manager.register(Person)
+    with patch.object(SchemaManager, "_type_exists", return_value=False):
+        schema_manager.sync_schema()
+
+    modified = SchemaManager(mock_db)
+    modified.register(PersonWithoutAge)
+    with patch.object(SchemaManager, "_type_exists", return_value=True):
+        with pytest.raises(SchemaConflictError):
+            modified.sync_schema()
+
+
+def test_force_sync_always_applies(mock_db):
+    """force=True recreates the database and reapplies the schema."""
+    schema_manager = SchemaManager(mock_db)
+    schema_manager.register(Person)
+
+    with patch.object(SchemaManager, "_type_exists", return_value=True):
+        schema_manager.sync_schema(force=True)
+        schema_manager.sync_schema(force=True)
+    assert _schema_applies(mock_db) == 2
+    assert mock_db.delete_database.call_count == 2
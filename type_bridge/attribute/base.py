@@ -1,7 +1,12 @@
 """Base Attribute class for TypeDB attribute types."""
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, ClassVar
+import sys
+from abc import ABC
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, get_origin
+
+from pydantic_core import CoreSchema, core_schema
 
 from type_bridge.validation import validate_type_name as validate_reserved_word
 
@@ -12,6 +17,88 @@ if TYPE_CHECKING:
 # TypeDB built-in type names that cannot be used for attributes
 TYPEDB_BUILTIN_TYPES = {"thing", "entity", "relation", "attribute"}
 
+# Cache of the bound (validator, serializer) pair per attribute class, keyed by
+# (cls, whether the source type is a Literal)
+_schema_function_cache: dict[tuple[type, bool], tuple[partial[Any], partial[Any]]] = {}
+
+# Cache of whether a source type annotation is a Literal, per annotation
+_literal_source_cache: dict[Any, bool] = {}
+
+
+def _is_literal_source(source_type: Any) -> bool:
+    """Return whether a source type is a Literal annotation, cached per annotation.
+
+    Most fields are annotated with the bare attribute class, so this saves a walk
+    through typing's introspection helpers on every schema request. Unhashable
+    annotations are inspected directly.
+    """
+    try:
+        return _literal_source_cache[source_type]
+    except KeyError:
+        is_literal = get_origin(source_type) is Literal
+        _literal_source_cache[source_type] = is_literal
+        return is_literal
+    except TypeError:
+        return get_origin(source_type) is Literal
+
+
+# Per-type validator (cls, value, info) and serializer (cls, value) functions;
+# build_attribute_schema binds cls with functools.partial
+type AttributeValidator = Callable[[Any, Any, core_schema.ValidationInfo], Any]
+type AttributeSerializer = Callable[[Any, Any], Any]
+
+
+def build_attribute_schema(
+    cls: type,
+    source_type: Any,
+    validate: AttributeValidator,
+    serialize: AttributeSerializer,
+    return_schema: CoreSchema,
+    validate_literal: AttributeValidator | None = None,
+) -> CoreSchema:
+    """Build the Pydantic core schema for an attribute class, reusing bound functions.
+
+    Pydantic calls ``__get_pydantic_core_schema__`` once per model field, so the same
+    attribute subclass used across many models would otherwise rebind its validator and
+    serializer each time. Those only depend on the class and on whether the source type
+    is a Literal, so they are bound once per key. The schema dict itself is built fresh
+    on every call: Pydantic mutates it in place when applying ``Annotated`` metadata,
+    so a shared dict would leak one field's customization into every other field.
+
+    Validators should check ``cls in type(value).__mro__`` rather than ``isinstance()``
+    so raw values skip ``ABCMeta.__instancecheck__`` (attribute classes derive from ABC).
+
+    Args:
+        cls: The Attribute subclass being validated
+        source_type: The annotation Pydantic is generating a schema for
+        validate: Module-level validator taking (cls, value, info)
+        serialize: Module-level serializer taking (cls, value)
+        return_schema: Schema of the serialized value; each attribute module builds it
+            once as ``_RETURN_SCHEMA`` and passes it for every class
+        validate_literal: Validator for Literal source types (defaults to ``validate``)
+
+    Returns:
+        Plain-validator core schema with a plain-function serializer
+    """
+    # The validators never look at the Literal values themselves, so every Literal
+    # annotation for a class (Literal["a", "b"], Literal["b"], ...) shares one pair
+    is_literal = _is_literal_source(source_type)
+    key = (cls, is_literal)
+    functions = _schema_function_cache.get(key)
+    if functions is None:
+        if validate_literal is not None and is_literal:
+            validate = validate_literal
+        functions = (partial(validate, cls), partial(serialize, cls))
+        _schema_function_cache[key] = functions
+    bound_validate, bound_serialize = functions
+    return core_schema.with_info_plain_validator_function(
+        bound_validate,
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            bound_serialize,
+            return_schema=return_schema,
+        ),
+    )
+
 
 def _validate_attribute_name(attr_name: str, class_name: str) -> None:
     """Validate that an attribute name doesn't conflict with TypeDB built-ins or TypeQL keywords.
@@ -37,6 +124,11 @@ def _validate_attribute_name(attr_name: str, class_name: str) -> None:
     validate_reserved_word(attr_name, "attribute")
 
 
+def identity_class_getitem(cls: type, item: object) -> type:
+    """Shared ``__class_getitem__`` for value types: ``Integer[int]`` is just ``Integer``."""
+    return cls
+
+
 class Attribute(ABC):
     """Base class for TypeDB attributes.
 
@@ -69,8 +161,14 @@ class Attribute(ABC):
 
         # Direct instantiation with wrapped types (best practice):
         person = Person(name=Name("Alice"), age=Age(30))
+
+    Instances only store their value in a slot. Subclasses that declare
+    ``__slots__ = ()`` keep that layout; otherwise Python adds a ``__dict__``.
     """
 
+    # Instances only carry their value; everything else is class-level metadata
+    __slots__ = ("_value",)
+
     # Class-level metadata
     value_type: ClassVar[str]  # TypeDB value type (string, integer, double, boolean, datetime)
     abstract: ClassVar[bool] = False
@@ -80,18 +178,21 @@ class Attribute(ABC):
         None  # Case formatting option (optional, defaults to CLASS_NAME)
     )
 
-    # Instance-level configuration (set via __init_subclass__)
-    _attr_name: str | None = None
-    _is_key: bool = False
-    _supertype: str | None = None
+    # Class-level configuration (set via __init_subclass__)
+    _attr_name: ClassVar[str | None] = None
+    _is_key: ClassVar[bool] = False
+    _supertype: ClassVar[str | None] = None
+    _schema_definition: ClassVar[str | None] = None  # Cached by to_schema_definition()
 
     # Instance-level value storage
-    _value: Any = None
+    _value: Any
 
-    @abstractmethod
     def __init__(self, value: Any = None):
         """Initialize attribute with a value.
 
+        Concrete types assign ``_value`` directly after converting the input
+        rather than calling this through super().
+
         Args:
             value: The value to store in this attribute instance
         """
@@ -101,6 +202,22 @@ class Attribute(ABC):
         """Called when a subclass is created."""
         super().__init_subclass__(**kwargs)
 
+        # Built-in attribute types (Boolean, Integer, String, etc.) are framework-provided
+        # and intentionally use TypeQL reserved words, so their name is neither validated
+        # nor needed up front; get_attribute_name() computes it on first use.
+        if cls.__module__.startswith("type_bridge.attribute"):
+            return
+
+        # Always set the attribute name for each new subclass (don't inherit from parent)
+        # This ensures Name(String) gets _attr_name="name", not "string"
+        cls._attr_name = cls._compute_attribute_name()
+
+        # Validate attribute name doesn't conflict with TypeDB built-ins
+        _validate_attribute_name(cls._attr_name, cls.__name__)
+
+    @classmethod
+    def _compute_attribute_name(cls) -> str:
+        """Compute the TypeDB attribute name from flags, attr_name, and case settings."""
         # Import here to avoid circular dependency
         from type_bridge.attribute.flags import (
             AttributeFlags,
@@ -113,35 +230,22 @@ class Attribute(ABC):
         flags = getattr(cls, "flags", None)
         if isinstance(flags, AttributeFlags) and flags.name is not None:
             # flags.name has highest priority
-            computed_name = flags.name
-        elif cls.attr_name is not None:
+            return flags.name
+        if cls.attr_name is not None:
             # Explicit attr_name takes precedence over formatting
-            computed_name = cls.attr_name
+            return cls.attr_name
+
+        # Determine case formatting
+        # Priority: flags.case > class.case > default CLASS_NAME
+        if isinstance(flags, AttributeFlags) and flags.case is not None:
+            case = flags.case
+        elif cls.case is not None:
+            case = cls.case
         else:
-            # Determine case formatting
-            # Priority: flags.case > class.case > default CLASS_NAME
-            if isinstance(flags, AttributeFlags) and flags.case is not None:
-                case = flags.case
-            elif cls.case is not None:
-                case = cls.case
-            else:
-                case = TypeNameCase.CLASS_NAME
-
-            # Apply case formatting to class name
-            computed_name = format_type_name(cls.__name__, case)
-
-        # Always set the attribute name for each new subclass (don't inherit from parent)
-        # This ensures Name(String) gets _attr_name="name", not "string"
-        cls._attr_name = computed_name
+            case = TypeNameCase.CLASS_NAME
 
-        # Skip validation for built-in attribute types (Boolean, Integer, String, etc.)
-        # These are framework-provided and intentionally use TypeQL reserved words
-        is_builtin = cls.__module__.startswith("type_bridge.attribute")
-
-        # Validate attribute name doesn't conflict with TypeDB built-ins
-        # Only validate user-defined attribute types, not framework built-ins
-        if not is_builtin:
-            _validate_attribute_name(cls._attr_name, cls.__name__)
+        # Apply case formatting to class name
+        return format_type_name(cls.__name__, case)
 
     @property
     def value(self) -> Any:
@@ -187,7 +291,12 @@ class Attribute(ABC):
         Otherwise, the class name is formatted according to the case parameter.
         Default case is CLASS_NAME (preserves class name as-is).
         """
-        return cls._attr_name or cls.__name__
+        # Look in the class's own namespace so subclasses never inherit a parent's name
+        name = cls.__dict__.get("_attr_name")
+        if name is None:
+            name = cls._compute_attribute_name()
+            cls._attr_name = name
+        return name
 
     @classmethod
     def get_value_type(cls) -> str:
@@ -218,6 +327,24 @@ class Attribute(ABC):
     def to_schema_definition(cls) -> str:
         """Generate TypeQL schema definition for this attribute.
 
+        The definition only depends on class-level configuration, so it is built
+        once per class and reused on later calls.
+
+        Returns:
+            TypeQL schema definition string
+        """
+        # Look in the class's own namespace so subclasses don't reuse a parent's definition
+        definition = cls.__dict__.get("_schema_definition")
+        if definition is None:
+            # Interned so classes that resolve to the same definition share one string
+            definition = sys.intern(cls._build_schema_definition())
+            cls._schema_definition = definition
+        return definition
+
+    @classmethod
+    def _build_schema_definition(cls) -> str:
+        """Build the TypeQL schema definition for this attribute.
+
         Includes support for TypeDB annotations:
         - @abstract (comes right after attribute name)
         - @independent (comes right after attribute name, allows standalone existence)
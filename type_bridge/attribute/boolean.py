@@ -5,12 +5,31 @@ from typing import Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 # TypeVar for proper type checking
 BoolValue = TypeVar("BoolValue", bound=bool)
 
 
+_RETURN_SCHEMA = core_schema.bool_schema()
+
+
+def _serialize_boolean(cls: type["Boolean"], value: Any) -> bool:
+    """Serialize a Boolean instance or raw value to bool."""
+    if cls in type(value).__mro__:
+        return bool(value._value) if value._value is not None else False
+    return bool(value)
+
+
+def _validate_boolean(
+    cls: type["Boolean"], value: Any, _info: core_schema.ValidationInfo
+) -> "Boolean":
+    """Validate a bool or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    return cls(bool(value))  # Wrap raw bool in attribute instance
+
+
 class Boolean(Attribute):
     """Boolean attribute type that accepts bool values.
 
@@ -22,6 +41,8 @@ class Boolean(Attribute):
             pass
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "boolean"
 
     def __init__(self, value: bool):
@@ -30,7 +51,7 @@ class Boolean(Attribute):
         Args:
             value: The boolean value to store
         """
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> bool:
@@ -46,28 +67,9 @@ class Boolean(Attribute):
         cls, source_type: type[BoolValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept bool values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_boolean(value: Any) -> bool:
-            if isinstance(value, cls):
-                return bool(value._value) if value._value is not None else False
-            return bool(value)
-
-        # Validator: accept bool or attribute instance, always return attribute instance
-        def validate_boolean(value: Any) -> "Boolean":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            return cls(bool(value))  # Wrap raw bool in attribute instance
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_boolean(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_boolean,
-                return_schema=core_schema.bool_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_boolean, _serialize_boolean, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Boolean"]:
-        """Allow generic subscription for type checking (e.g., Boolean[bool])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Boolean[bool])
+    __class_getitem__ = classmethod(identity_class_getitem)
@@ -7,12 +7,40 @@ from typing import Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 # TypeVar for proper type checking
 DateValue = TypeVar("DateValue", bound=date_type)
 
 
+_RETURN_SCHEMA = core_schema.date_schema()
+
+
+def _serialize_date(cls: type["Date"], value: Any) -> date_type:
+    """Serialize a Date instance or raw value to date."""
+    if cls in type(value).__mro__:
+        return value._value if value._value is not None else date_type.today()
+    if isinstance(value, date_type):
+        return value
+    if isinstance(value, datetime_type):
+        return value.date()
+    # Try to parse ISO string
+    return date_type.fromisoformat(str(value))
+
+
+def _validate_date(cls: type["Date"], value: Any, _info: core_schema.ValidationInfo) -> "Date":
+    """Validate a date or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    # Wrap date value in attribute instance
+    if isinstance(value, date_type):
+        return cls(value)
+    if isinstance(value, datetime_type):
+        return cls(value.date())
+    # Try to parse ISO string
+    return cls(date_type.fromisoformat(str(value)))
+
+
 class Date(Attribute):
     """Date attribute type that accepts date values (date only, no time).
 
@@ -35,6 +63,8 @@ class Date(Attribute):
         birthday = BirthDate(date(1990, 5, 15))
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "date"
 
     def __init__(self, value: date_type | str):
@@ -59,7 +89,7 @@ class Date(Attribute):
         elif isinstance(value, datetime_type):
             # If passed a datetime, extract just the date part
             value = value.date()
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> date_type:
@@ -71,39 +101,9 @@ class Date(Attribute):
         cls, source_type: type[DateValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept date values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_date(value: Any) -> date_type:
-            if isinstance(value, cls):
-                return value._value if value._value is not None else date_type.today()
-            if isinstance(value, date_type):
-                return value
-            if isinstance(value, datetime_type):
-                return value.date()
-            # Try to parse ISO string
-            return date_type.fromisoformat(str(value))
-
-        # Validator: accept date or attribute instance, always return attribute instance
-        def validate_date(value: Any) -> "Date":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            # Wrap date value in attribute instance
-            if isinstance(value, date_type):
-                return cls(value)
-            if isinstance(value, datetime_type):
-                return cls(value.date())
-            # Try to parse ISO string
-            return cls(date_type.fromisoformat(str(value)))
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_date(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_date,
-                return_schema=core_schema.date_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_date, _serialize_date, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Date"]:
-        """Allow generic subscription for type checking (e.g., Date[date])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Date[date])
+    __class_getitem__ = classmethod(identity_class_getitem)
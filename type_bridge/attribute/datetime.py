@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 if TYPE_CHECKING:
     from type_bridge.attribute.datetimetz import DateTimeTZ
@@ -16,6 +16,28 @@ if TYPE_CHECKING:
 DateTimeValue = TypeVar("DateTimeValue", bound=datetime_type)
 
 
+_RETURN_SCHEMA = core_schema.datetime_schema()
+
+
+def _serialize_datetime(cls: type["DateTime"], value: Any) -> datetime_type:
+    """Serialize a DateTime instance or raw value to datetime."""
+    if cls in type(value).__mro__:
+        return value._value if value._value is not None else datetime_type.now()
+    return value if isinstance(value, datetime_type) else datetime_type.fromisoformat(str(value))
+
+
+def _validate_datetime(
+    cls: type["DateTime"], value: Any, _info: core_schema.ValidationInfo
+) -> "DateTime":
+    """Validate a datetime or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    # Wrap raw datetime in attribute instance
+    if isinstance(value, datetime_type):
+        return cls(value)
+    return cls(datetime_type.fromisoformat(str(value)))
+
+
 class DateTime(Attribute):
     """DateTime attribute type that accepts naive datetime values.
 
@@ -33,6 +55,8 @@ class DateTime(Attribute):
         aware_dt_utc = created_at.add_timezone(timezone.utc)  # Explicit: add UTC
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "datetime"
 
     def __init__(self, value: datetime_type):
@@ -41,7 +65,7 @@ class DateTime(Attribute):
         Args:
             value: The datetime value to store
         """
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> datetime_type:
@@ -121,35 +145,9 @@ class DateTime(Attribute):
         cls, source_type: type[DateTimeValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept datetime values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_datetime(value: Any) -> datetime_type:
-            if isinstance(value, cls):
-                return value._value if value._value is not None else datetime_type.now()
-            return (
-                value
-                if isinstance(value, datetime_type)
-                else datetime_type.fromisoformat(str(value))
-            )
-
-        # Validator: accept datetime or attribute instance, always return attribute instance
-        def validate_datetime(value: Any) -> "DateTime":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            # Wrap raw datetime in attribute instance
-            if isinstance(value, datetime_type):
-                return cls(value)
-            return cls(datetime_type.fromisoformat(str(value)))
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_datetime(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_datetime,
-                return_schema=core_schema.datetime_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_datetime, _serialize_datetime, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["DateTime"]:
-        """Allow generic subscription for type checking (e.g., DateTime[datetime])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., DateTime[datetime])
+    __class_getitem__ = classmethod(identity_class_getitem)
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 if TYPE_CHECKING:
     from type_bridge.attribute.datetime import DateTime
@@ -17,6 +17,44 @@ if TYPE_CHECKING:
 DateTimeTZValue = TypeVar("DateTimeTZValue", bound=datetime_type)
 
 
+_RETURN_SCHEMA = core_schema.datetime_schema()
+
+
+def _serialize_datetimetz(cls: type["DateTimeTZ"], value: Any) -> datetime_type:
+    """Serialize a DateTimeTZ instance or raw value to a timezone-aware datetime."""
+    if cls in type(value).__mro__:
+        if value._value is None:
+            return datetime_type.now(UTC)
+        return value._value
+    if isinstance(value, datetime_type):
+        if value.tzinfo is None:
+            raise ValueError("DateTimeTZ requires timezone-aware datetime")
+        return value
+    # Try to parse ISO string with timezone
+    dt = datetime_type.fromisoformat(str(value))
+    if dt.tzinfo is None:
+        raise ValueError("DateTimeTZ requires timezone-aware datetime")
+    return dt
+
+
+def _validate_datetimetz(
+    cls: type["DateTimeTZ"], value: Any, _info: core_schema.ValidationInfo
+) -> "DateTimeTZ":
+    """Validate a timezone-aware datetime or attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    # Wrap timezone-aware datetime in attribute instance
+    if isinstance(value, datetime_type):
+        if value.tzinfo is None:
+            raise ValueError("DateTimeTZ requires timezone-aware datetime")
+        return cls(value)
+    # Try to parse ISO string with timezone
+    dt = datetime_type.fromisoformat(str(value))
+    if dt.tzinfo is None:
+        raise ValueError("DateTimeTZ requires timezone-aware datetime")
+    return cls(dt)
+
+
 class DateTimeTZ(Attribute):
     """DateTimeTZ attribute type that accepts timezone-aware datetime values.
 
@@ -37,6 +75,8 @@ class DateTimeTZ(Attribute):
         naive_dt_jst = created_at.strip_timezone(timezone(timedelta(hours=9)))  # Explicit: convert to JST, then strip
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "datetime-tz"
 
     def __init__(self, value: datetime_type):
@@ -53,7 +93,7 @@ class DateTimeTZ(Attribute):
                 "DateTimeTZ requires timezone-aware datetime. "
                 "Use DateTime for naive datetime or add tzinfo (e.g., datetime.timezone.utc)"
             )
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> datetime_type:
@@ -133,47 +173,13 @@ class DateTimeTZ(Attribute):
         cls, source_type: type[DateTimeTZValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept timezone-aware datetime values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_datetimetz(value: Any) -> datetime_type:
-            if isinstance(value, cls):
-                if value._value is None:
-                    return datetime_type.now(UTC)
-                return value._value
-            if isinstance(value, datetime_type):
-                if value.tzinfo is None:
-                    raise ValueError("DateTimeTZ requires timezone-aware datetime")
-                return value
-            # Try to parse ISO string with timezone
-            dt = datetime_type.fromisoformat(str(value))
-            if dt.tzinfo is None:
-                raise ValueError("DateTimeTZ requires timezone-aware datetime")
-            return dt
-
-        # Validator: accept timezone-aware datetime or attribute instance
-        def validate_datetimetz(value: Any) -> DateTimeTZ:
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            # Wrap timezone-aware datetime in attribute instance
-            if isinstance(value, datetime_type):
-                if value.tzinfo is None:
-                    raise ValueError("DateTimeTZ requires timezone-aware datetime")
-                return cls(value)
-            # Try to parse ISO string with timezone
-            dt = datetime_type.fromisoformat(str(value))
-            if dt.tzinfo is None:
-                raise ValueError("DateTimeTZ requires timezone-aware datetime")
-            return cls(dt)
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_datetimetz(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_datetimetz,
-                return_schema=core_schema.datetime_schema(),
-            ),
+        return build_attribute_schema(
+            cls,
+            source_type,
+            _validate_datetimetz,
+            _serialize_datetimetz,
+            _RETURN_SCHEMA,
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["DateTimeTZ"]:
-        """Allow generic subscription for type checking (e.g., DateTimeTZ[datetime])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., DateTimeTZ[datetime])
+    __class_getitem__ = classmethod(identity_class_getitem)
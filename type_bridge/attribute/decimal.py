@@ -6,12 +6,42 @@ from typing import Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 # TypeVar for proper type checking
 DecimalValue = TypeVar("DecimalValue", bound=DecimalType)
 
 
+_RETURN_SCHEMA = core_schema.decimal_schema()
+
+
+def _serialize_decimal(cls: type["Decimal"], value: Any) -> DecimalType:
+    """Serialize a Decimal instance or raw value to decimal.Decimal."""
+    if cls in type(value).__mro__:
+        return value._value if value._value is not None else DecimalType("0")
+    if isinstance(value, DecimalType):
+        return value
+    # Convert from string, int, or float
+    return DecimalType(str(value))
+
+
+def _validate_decimal(
+    cls: type["Decimal"], value: Any, _info: core_schema.ValidationInfo
+) -> "Decimal":
+    """Validate a decimal or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    # Wrap decimal value in attribute instance
+    if isinstance(value, DecimalType):
+        return cls(value)
+    # Try to parse from string, int, or float
+    # Strip 'dec' suffix if present (TypeDB returns decimals with 'dec' suffix)
+    value_str = str(value)
+    if value_str.endswith("dec"):
+        value_str = value_str[:-3]  # Remove 'dec' suffix
+    return cls(DecimalType(value_str))
+
+
 class Decimal(Attribute):
     """Decimal attribute type that accepts fixed-point decimal values.
 
@@ -35,6 +65,8 @@ class Decimal(Attribute):
         price = Price(DecimalType("0.02"))
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "decimal"
 
     def __init__(self, value: DecimalType | str | int | float):
@@ -60,7 +92,7 @@ class Decimal(Attribute):
         """
         if not isinstance(value, DecimalType):
             value = DecimalType(str(value))
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> DecimalType:
@@ -72,39 +104,9 @@ class Decimal(Attribute):
         cls, source_type: type[DecimalValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept decimal values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_decimal(value: Any) -> DecimalType:
-            if isinstance(value, cls):
-                return value._value if value._value is not None else DecimalType("0")
-            if isinstance(value, DecimalType):
-                return value
-            # Convert from string, int, or float
-            return DecimalType(str(value))
-
-        # Validator: accept decimal or attribute instance, always return attribute instance
-        def validate_decimal(value: Any) -> "Decimal":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            # Wrap decimal value in attribute instance
-            if isinstance(value, DecimalType):
-                return cls(value)
-            # Try to parse from string, int, or float
-            # Strip 'dec' suffix if present (TypeDB returns decimals with 'dec' suffix)
-            value_str = str(value)
-            if value_str.endswith("dec"):
-                value_str = value_str[:-3]  # Remove 'dec' suffix
-            return cls(DecimalType(value_str))
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_decimal(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_decimal,
-                return_schema=core_schema.decimal_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_decimal, _serialize_decimal, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Decimal"]:
-        """Allow generic subscription for type checking (e.g., Decimal[decimal.Decimal])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Decimal[decimal.Decimal])
+    __class_getitem__ = classmethod(identity_class_getitem)
@@ -5,12 +5,49 @@ from typing import Any, ClassVar, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 # TypeVar for proper type checking
 FloatValue = TypeVar("FloatValue", bound=float)
 
 
+_RETURN_SCHEMA = core_schema.float_schema()
+
+
+def _serialize_double(cls: type["Double"], value: Any) -> float:
+    """Serialize a Double instance or raw value to float."""
+    if cls in type(value).__mro__:
+        return float(value._value) if value._value is not None else 0.0
+    return float(value)
+
+
+def _validate_double(
+    cls: type["Double"], value: Any, _info: core_schema.ValidationInfo
+) -> "Double":
+    """Validate a float or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        float_value = value._value
+    else:
+        float_value = float(value)
+
+    # Check range constraint if defined on the class
+    range_constraint = getattr(cls, "range_constraint", None)
+    if range_constraint is not None:
+        range_min, range_max = range_constraint
+        if range_min is not None:
+            min_val = float(range_min)
+            if float_value < min_val:
+                raise ValueError(f"{cls.__name__} value {float_value} is below minimum {min_val}")
+        if range_max is not None:
+            max_val = float(range_max)
+            if float_value > max_val:
+                raise ValueError(f"{cls.__name__} value {float_value} is above maximum {max_val}")
+
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    return cls(float_value)  # Wrap raw float in attribute instance
+
+
 class Double(Attribute):
     """Double precision float attribute type that accepts float values.
 
@@ -22,6 +59,8 @@ class Double(Attribute):
             pass
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "double"
 
     def __init__(self, value: float):
@@ -52,7 +91,7 @@ class Double(Attribute):
                         f"{self.__class__.__name__} value {float_value} is above maximum {max_val}"
                     )
 
-        super().__init__(float_value)
+        self._value = float_value
 
     @property
     def value(self) -> float:
@@ -192,50 +231,9 @@ class Double(Attribute):
         cls, source_type: type[FloatValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept float values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_double(value: Any) -> float:
-            if isinstance(value, cls):
-                return float(value._value) if value._value is not None else 0.0
-            return float(value)
-
-        # Validator: accept float or attribute instance, always return attribute instance
-        def validate_double(value: Any) -> "Double":
-            if isinstance(value, cls):
-                float_value = value._value
-            else:
-                float_value = float(value)
-
-            # Check range constraint if defined on the class
-            range_constraint = getattr(cls, "range_constraint", None)
-            if range_constraint is not None:
-                range_min, range_max = range_constraint
-                if range_min is not None:
-                    min_val = float(range_min)
-                    if float_value < min_val:
-                        raise ValueError(
-                            f"{cls.__name__} value {float_value} is below minimum {min_val}"
-                        )
-                if range_max is not None:
-                    max_val = float(range_max)
-                    if float_value > max_val:
-                        raise ValueError(
-                            f"{cls.__name__} value {float_value} is above maximum {max_val}"
-                        )
-
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            return cls(float_value)  # Wrap raw float in attribute instance
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_double(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_double,
-                return_schema=core_schema.float_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_double, _serialize_double, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Double"]:
-        """Allow generic subscription for type checking (e.g., Double[float])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Double[float])
+    __class_getitem__ = classmethod(identity_class_getitem)
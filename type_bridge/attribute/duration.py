@@ -8,7 +8,7 @@ from isodate import Duration as IsodateDuration
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 if TYPE_CHECKING:
     pass
@@ -67,6 +67,34 @@ def _timedelta_to_duration(td: timedelta) -> IsodateDuration:
     return IsodateDuration(months=0, days=td.days, seconds=td.seconds, microseconds=td.microseconds)
 
 
+_RETURN_SCHEMA = core_schema.timedelta_schema()
+
+
+def _serialize_duration(cls: type["Duration"], value: Any) -> IsodateDuration:
+    """Serialize a Duration instance or raw value to an isodate Duration."""
+    if cls in type(value).__mro__:
+        return value._value if value._value is not None else IsodateDuration()
+    if isinstance(value, IsodateDuration):
+        return value
+    if isinstance(value, timedelta):
+        return _timedelta_to_duration(value)
+    # Try to parse ISO string
+    return isodate.parse_duration(str(value))
+
+
+def _validate_duration(
+    cls: type["Duration"], value: Any, _info: core_schema.ValidationInfo
+) -> "Duration":
+    """Validate various duration formats, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    # Wrap duration value in attribute instance
+    if isinstance(value, (IsodateDuration, timedelta)):
+        return cls(value)
+    # Try to parse ISO string
+    return cls(isodate.parse_duration(str(value)))
+
+
 class Duration(Attribute):
     """Duration attribute type that accepts ISO 8601 duration values.
 
@@ -102,6 +130,8 @@ class Duration(Attribute):
         complex = EventCadence("P1Y2M3DT4H5M6.789S")
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "duration"
 
     def __init__(self, value: str | timedelta | IsodateDuration):
@@ -138,7 +168,7 @@ class Duration(Attribute):
         if isinstance(value, IsodateDuration):
             _validate_duration_limits(value)
 
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> IsodateDuration:
@@ -210,37 +240,9 @@ class Duration(Attribute):
         cls, source_type: type[DurationValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept duration values or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_duration(value: Any) -> IsodateDuration:
-            if isinstance(value, cls):
-                return value._value if value._value is not None else IsodateDuration()
-            if isinstance(value, IsodateDuration):
-                return value
-            if isinstance(value, timedelta):
-                return _timedelta_to_duration(value)
-            # Try to parse ISO string
-            return isodate.parse_duration(str(value))
-
-        # Validator: accept various duration formats, always return attribute instance
-        def validate_duration(value: Any) -> "Duration":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            # Wrap duration value in attribute instance
-            if isinstance(value, (IsodateDuration, timedelta)):
-                return cls(value)
-            # Try to parse ISO string
-            return cls(isodate.parse_duration(str(value)))
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_duration(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_duration,
-                return_schema=core_schema.timedelta_schema(),
-            ),
+        return build_attribute_schema(
+            cls, source_type, _validate_duration, _serialize_duration, _RETURN_SCHEMA
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Duration"]:
-        """Allow generic subscription for type checking (e.g., Duration[timedelta])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Duration[timedelta])
+    __class_getitem__ = classmethod(identity_class_getitem)
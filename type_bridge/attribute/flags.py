@@ -4,6 +4,7 @@ import re
 import warnings
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from typing import Annotated, Any, TypeVar
 
 T = TypeVar("T")
@@ -84,7 +85,7 @@ def format_type_name(class_name: str, case: TypeNameCase) -> str:
         return class_name.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeFlags:
     """Metadata flags for Entity and Relation classes.
 
@@ -174,6 +175,8 @@ class Card:
         age: Optional[Age]                        # ✓ Correct
     """
 
+    __slots__ = ("min", "max")
+
     def __init__(self, *args: int, min: int | None = None, max: int | None = None):
         """Initialize cardinality marker.
 
@@ -183,30 +186,26 @@ class Card:
         - Card(max=5) → min=0, max=5 (defaults min to 0)
         - Card(min=0, max=10) → min=0, max=10
         """
-        self.min: int | None = None
-        self.max: int | None = None
-        if args:
-            # Positional arguments: Card(1, 5) or Card(2)
-            if len(args) == 1:
-                self.min = args[0]
-                self.max = max  # Use keyword arg if provided
-            elif len(args) == 2:
-                self.min = args[0]
-                self.max = args[1]
-            else:
-                raise ValueError("Card accepts at most 2 positional arguments")
-        else:
+        self.min: int | None
+        self.max: int | None
+        n = len(args)
+        if n == 2:
+            # Positional range: Card(1, 5)
+            self.min, self.max = args
+        elif n == 0:
             # Keyword arguments only
             # If only max is specified, default min to 0
-            if min is None and max is not None:
-                self.min = 0
-                self.max = max
-            else:
-                self.min = min
-                self.max = max
+            self.min = 0 if min is None and max is not None else min
+            self.max = max
+        elif n == 1:
+            # Positional minimum: Card(2), optionally with max=...
+            self.min = args[0]
+            self.max = max  # Use keyword arg if provided
+        else:
+            raise ValueError("Card accepts at most 2 positional arguments")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AttributeFlags:
     """Metadata for attribute ownership and type configuration.
 
@@ -228,6 +227,8 @@ class AttributeFlags:
         # Or use case formatting
         class PersonName(String):
             flags = AttributeFlags(case=TypeNameCase.SNAKE_CASE)  # -> person_name
+
+    Instances are immutable; use dataclasses.replace() to derive modified flags.
     """
 
     is_key: bool = False
@@ -249,30 +250,44 @@ class AttributeFlags:
         Returns:
             List of TypeQL annotation strings
         """
-        annotations = []
-        if self.is_key:
-            annotations.append("@key")
-        if self.is_unique:
-            annotations.append("@unique")
-
-        # Only output @card if:
-        # 1. Not a @key (since @key always implies @card(1..1))
-        # 2. Not (@unique with default @card(1..1))
-        should_output_card = self.card_min is not None or self.card_max is not None
-
-        if should_output_card and not self.is_key:
-            # Check if it's @unique with default (1,1) - if so, omit @card
-            is_default_card = self.card_min == 1 and self.card_max == 1
-            if not (self.is_unique and is_default_card):
-                min_val = self.card_min if self.card_min is not None else 0
-                if self.card_max is not None:
-                    # Use .. syntax for range: @card(1..5)
-                    annotations.append(f"@card({min_val}..{self.card_max})")
-                else:
-                    # Unbounded max: @card(min..)
-                    annotations.append(f"@card({min_val}..)")
-
-        return annotations
+        return list(_typeql_annotations(self.is_key, self.is_unique, self.card_min, self.card_max))
+
+
+@cache
+def _typeql_annotations(
+    is_key: bool, is_unique: bool, card_min: int | None, card_max: int | None
+) -> tuple[str, ...]:
+    """Build TypeQL ownership annotations, cached per distinct flag combination."""
+    annotations = []
+    if is_key:
+        annotations.append("@key")
+    if is_unique:
+        annotations.append("@unique")
+
+    # Only output @card if:
+    # 1. Not a @key (since @key always implies @card(1..1))
+    # 2. Not (@unique with default @card(1..1))
+    should_output_card = card_min is not None or card_max is not None
+
+    if should_output_card and not is_key:
+        # Check if it's @unique with default (1,1) - if so, omit @card
+        is_default_card = card_min == 1 and card_max == 1
+        if not (is_unique and is_default_card):
+            min_val = card_min if card_min is not None else 0
+            if card_max is not None:
+                # Use .. syntax for range: @card(1..5)
+                annotations.append(f"@card({min_val}..{card_max})")
+            else:
+                # Unbounded max: @card(min..)
+                annotations.append(f"@card({min_val}..)")
+
+    return tuple(annotations)
+
+
+# Shared results for the most common marker combinations (AttributeFlags is frozen)
+_FLAG_KEY = AttributeFlags(is_key=True, card_min=1, card_max=1)
+_FLAG_UNIQUE = AttributeFlags(is_unique=True)
+_FLAG_KEY_UNIQUE = AttributeFlags(is_key=True, is_unique=True, card_min=1, card_max=1)
 
 
 def Flag(*annotations: Any) -> Annotated[Any, AttributeFlags]:
@@ -303,25 +318,48 @@ def Flag(*annotations: Any) -> Annotated[Any, AttributeFlags]:
             age: Optional[Age]                        # @card(0..1)
             tags: list[Tag] = Flag(Card(min=2))       # @card(2..)
             jobs: list[Job] = Flag(Card(1, 5))        # @card(1..5)
+
+    Flag(Key), Flag(Unique) and Flag(Key, Unique) return shared instances.
     """
-    flags = AttributeFlags()
+    # Fast paths: bare Key/Unique markers without Card
+    n = len(annotations)
+    if n == 1:
+        ann = annotations[0]
+        if ann is Key:
+            return _FLAG_KEY
+        if ann is Unique:
+            return _FLAG_UNIQUE
+    elif n == 2:
+        first, second = annotations
+        if (first is Key and second is Unique) or (first is Unique and second is Key):
+            return _FLAG_KEY_UNIQUE
+
+    is_key = False
+    is_unique = False
+    card_min: int | None = None
+    card_max: int | None = None
     has_card = False
 
     for ann in annotations:
         if ann is Key:
-            flags.is_key = True
+            is_key = True
         elif ann is Unique:
-            flags.is_unique = True
+            is_unique = True
         elif isinstance(ann, Card):
             # Extract cardinality from Card instance
-            flags.card_min = ann.min
-            flags.card_max = ann.max
-            flags.has_explicit_card = True
+            card_min = ann.min
+            card_max = ann.max
             has_card = True
 
     # If Key was used but no Card, set default card(1,1)
-    if flags.is_key and not has_card:
-        flags.card_min = 1
-        flags.card_max = 1
-
-    return flags
+    if is_key and not has_card:
+        card_min = 1
+        card_max = 1
+
+    return AttributeFlags(
+        is_key=is_key,
+        is_unique=is_unique,
+        card_min=card_min,
+        card_max=card_max,
+        has_explicit_card=has_card,
+    )
@@ -1,16 +1,60 @@
 """Integer attribute type for TypeDB."""
 
-from typing import Any, ClassVar, Literal, TypeVar, get_origin
+from typing import Any, ClassVar, TypeVar
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema, identity_class_getitem
 
 # TypeVar for proper type checking
 IntValue = TypeVar("IntValue", bound=int)
 
 
+_RETURN_SCHEMA = core_schema.int_schema()
+
+
+def _serialize_long(cls: type["Integer"], value: Any) -> int:
+    """Serialize an Integer instance or raw value to int."""
+    if cls in type(value).__mro__:
+        return int(value._value) if value._value is not None else 0
+    return int(value)
+
+
+def _validate_long(
+    cls: type["Integer"], value: Any, _info: core_schema.ValidationInfo
+) -> "Integer":
+    """Validate an int or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        int_value = value._value
+    else:
+        int_value = int(value)
+
+    # Check range constraint if defined on the class
+    range_constraint = getattr(cls, "range_constraint", None)
+    if range_constraint is not None:
+        range_min, range_max = range_constraint
+        if range_min is not None:
+            min_val = int(range_min)
+            if int_value < min_val:
+                raise ValueError(f"{cls.__name__} value {int_value} is below minimum {min_val}")
+        if range_max is not None:
+            max_val = int(range_max)
+            if int_value > max_val:
+                raise ValueError(f"{cls.__name__} value {int_value} is above maximum {max_val}")
+
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    return cls(int_value)  # Wrap raw int in attribute instance
+
+
+def _validate_long_literal(
+    cls: type["Integer"], value: Any, _info: core_schema.ValidationInfo
+) -> Any:
+    """Validate a Literal-typed field, unwrapping attribute instances to their raw value."""
+    return value._value if cls in type(value).__mro__ else value
+
+
 class Integer(Attribute):
     """Integer attribute type that accepts int values.
 
@@ -28,6 +72,8 @@ class Integer(Attribute):
         priority: Literal[1, 2, 3] | Priority
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "integer"
 
     def __init__(self, value: int):
@@ -58,7 +104,7 @@ class Integer(Attribute):
                         f"{self.__class__.__name__} value {int_value} is above maximum {max_val}"
                     )
 
-        super().__init__(int_value)
+        self._value = int_value
 
     @property
     def value(self) -> int:
@@ -182,61 +228,14 @@ class Integer(Attribute):
         cls, source_type: type[IntValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept int values, Literal types, or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_long(value: Any) -> int:
-            if isinstance(value, cls):
-                return int(value._value) if value._value is not None else 0
-            return int(value)
-
-        # Check if source_type is a Literal type
-        if get_origin(source_type) is Literal:
-            # Convert tuple to list for literal_schema
-            return core_schema.with_info_plain_validator_function(
-                lambda v, _: v._value if isinstance(v, cls) else v,
-                serialization=core_schema.plain_serializer_function_ser_schema(
-                    serialize_long,
-                    return_schema=core_schema.int_schema(),
-                ),
-            )
-
-        # Default: accept int or attribute instance, always return attribute instance
-        def validate_long(value: Any) -> "Integer":
-            if isinstance(value, cls):
-                int_value = value._value
-            else:
-                int_value = int(value)
-
-            # Check range constraint if defined on the class
-            range_constraint = getattr(cls, "range_constraint", None)
-            if range_constraint is not None:
-                range_min, range_max = range_constraint
-                if range_min is not None:
-                    min_val = int(range_min)
-                    if int_value < min_val:
-                        raise ValueError(
-                            f"{cls.__name__} value {int_value} is below minimum {min_val}"
-                        )
-                if range_max is not None:
-                    max_val = int(range_max)
-                    if int_value > max_val:
-                        raise ValueError(
-                            f"{cls.__name__} value {int_value} is above maximum {max_val}"
-                        )
-
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            return cls(int_value)  # Wrap raw int in attribute instance
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_long(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_long,
-                return_schema=core_schema.int_schema(),
-            ),
+        return build_attribute_schema(
+            cls,
+            source_type,
+            _validate_long,
+            _serialize_long,
+            _RETURN_SCHEMA,
+            _validate_long_literal,
         )
 
-    @classmethod
-    def __class_getitem__(cls, item: object) -> type["Integer"]:
-        """Allow generic subscription for type checking (e.g., Integer[int])."""
-        return cls
+    # Allow generic subscription for type checking (e.g., Integer[int])
+    __class_getitem__ = classmethod(identity_class_getitem)
@@ -1,11 +1,11 @@
 """String attribute type for TypeDB."""
 
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, get_origin
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
-from type_bridge.attribute.base import Attribute
+from type_bridge.attribute.base import Attribute, build_attribute_schema
 
 if TYPE_CHECKING:
     from type_bridge.expressions import StringExpr
@@ -17,6 +17,32 @@ StrValue = TypeVar("StrValue", bound=str)
 StringType = TypeVar("StringType", bound="String")
 
 
+_RETURN_SCHEMA = core_schema.str_schema()
+
+
+def _serialize_string(cls: type["String"], value: Any) -> str:
+    """Serialize a String instance or raw value to str."""
+    if cls in type(value).__mro__:
+        return str(value._value) if value._value is not None else ""
+    return str(value)
+
+
+def _validate_string(
+    cls: type["String"], value: Any, _info: core_schema.ValidationInfo
+) -> "String":
+    """Validate a str or attribute instance, always returning an attribute instance."""
+    if cls in type(value).__mro__:
+        return value  # Return attribute instance as-is
+    return cls(str(value))  # Wrap raw str in attribute instance
+
+
+def _validate_string_literal(
+    cls: type["String"], value: Any, _info: core_schema.ValidationInfo
+) -> Any:
+    """Validate a Literal-typed field, unwrapping attribute instances to their raw value."""
+    return value._value if cls in type(value).__mro__ else value
+
+
 class String(Attribute):
     """String attribute type that accepts str values.
 
@@ -34,6 +60,8 @@ class String(Attribute):
         status: Literal["active", "inactive"] | Status
     """
 
+    __slots__ = ()
+
     value_type: ClassVar[str] = "string"
 
     def __init__(self, value: str):
@@ -42,7 +70,7 @@ class String(Attribute):
         Args:
             value: The string value to store
         """
-        super().__init__(value)
+        self._value = value
 
     @property
     def value(self) -> str:
@@ -74,36 +102,13 @@ class String(Attribute):
         cls, source_type: type[StrValue], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Pydantic validation: accept str values, Literal types, or attribute instances."""
-
-        # Serializer to extract value from attribute instances
-        def serialize_string(value: Any) -> str:
-            if isinstance(value, cls):
-                return str(value._value) if value._value is not None else ""
-            return str(value)
-
-        # Check if source_type is a Literal type
-        if get_origin(source_type) is Literal:
-            # Convert tuple to list for literal_schema
-            return core_schema.with_info_plain_validator_function(
-                lambda v, _: v._value if isinstance(v, cls) else v,
-                serialization=core_schema.plain_serializer_function_ser_schema(
-                    serialize_string,
-                    return_schema=core_schema.str_schema(),
-                ),
-            )
-
-        # Default: accept str or attribute instance, always return attribute instance
-        def validate_string(value: Any) -> "String":
-            if isinstance(value, cls):
-                return value  # Return attribute instance as-is
-            return cls(str(value))  # Wrap raw str in attribute instance
-
-        return core_schema.with_info_plain_validator_function(
-            lambda v, _: validate_string(v),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize_string,
-                return_schema=core_schema.str_schema(),
-            ),
+        return build_attribute_schema(
+            cls,
+            source_type,
+            _validate_string,
+            _serialize_string,
+            _RETURN_SCHEMA,
+            _validate_string_literal,
         )
 
     # ========================================================================
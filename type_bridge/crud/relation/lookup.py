@@ -23,7 +23,10 @@ from type_bridge.expressions import (
 
 if TYPE_CHECKING:
     from type_bridge.attribute import Attribute
-    from type_bridge.models import Relation
+    from type_bridge.models import Entity, Relation
+
+# Cache of resolved role-player attribute types, keyed by (relation class, role, field)
+_role_attribute_cache: dict[tuple[type[Relation], str, str], type[Attribute]] = {}
 
 
 def parse_role_lookup_filters(
@@ -173,14 +176,6 @@ def _parse_role_attribute_lookup(
             player_types=player_types,
         )
 
-    # Collect all attributes from all player types (for Role.multi)
-    all_player_attrs: dict[str, tuple[type[Attribute], Any]] = {}
-    for player_type in player_types:
-        player_attrs = player_type.get_all_attributes()
-        for field_name, attr_info in player_attrs.items():
-            if field_name not in all_player_attrs:
-                all_player_attrs[field_name] = (attr_info.typ, attr_info)
-
     # Parse: either [attr] or [attr, lookup]
     if len(parts) == 1:
         field_name = parts[0]
@@ -193,15 +188,7 @@ def _parse_role_attribute_lookup(
             f"got too many parts: {parts}"
         )
 
-    # Validate field exists on at least one player type
-    if field_name not in all_player_attrs:
-        available = list(all_player_attrs.keys())
-        raise ValueError(
-            f"Role '{role_name}' players do not have attribute '{field_name}'. "
-            f"Available attributes: {available}"
-        )
-
-    attr_type, attr_info = all_player_attrs[field_name]
+    attr_type = _resolve_role_player_attribute(model_class, role_name, field_name)
 
     # Build inner expression based on lookup type
     inner_expr = _build_lookup_expression(attr_type, lookup, value)
@@ -214,6 +201,55 @@ def _parse_role_attribute_lookup(
     )
 
 
+def _resolve_role_player_attribute(
+    model_class: type[Relation],
+    role_name: str,
+    field_name: str,
+) -> type[Attribute]:
+    """Resolve a role-player field name to its attribute type.
+
+    The result depends only on the class definitions, so it is cached per
+    (relation class, role, field) to avoid walking every player type's
+    attributes on each filter() call.
+
+    Args:
+        model_class: The Relation class
+        role_name: Name of the role (e.g., "employee")
+        field_name: Attribute field name on the role player (e.g., "age")
+
+    Returns:
+        Attribute type of the field on the first player type that owns it
+
+    Raises:
+        ValueError: If no player type of the role has the attribute
+    """
+    cache_key = (model_class, role_name, field_name)
+    cached = _role_attribute_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    player_types: tuple[type[Entity], ...] = model_class._roles[role_name].player_entity_types
+
+    # Collect all attributes from all player types (for Role.multi)
+    all_player_attrs: dict[str, type[Attribute]] = {}
+    for player_type in player_types:
+        for name, attr_info in player_type.get_all_attributes().items():
+            if name not in all_player_attrs:
+                all_player_attrs[name] = attr_info.typ
+
+    # Validate field exists on at least one player type
+    if field_name not in all_player_attrs:
+        available = list(all_player_attrs.keys())
+        raise ValueError(
+            f"Role '{role_name}' players do not have attribute '{field_name}'. "
+            f"Available attributes: {available}"
+        )
+
+    attr_type = all_player_attrs[field_name]
+    _role_attribute_cache[cache_key] = attr_type
+    return attr_type
+
+
 def _build_lookup_expression(
     attr_type: type[Attribute],
     lookup: str,
@@ -19,7 +19,12 @@ from pydantic._internal._model_construction import ModelMetaclass
 from type_bridge.attribute import AttributeFlags, TypeFlags
 from type_bridge.models.base import TypeDBType
 from type_bridge.models.role import Role
-from type_bridge.models.utils import ModelAttrInfo, extract_metadata
+from type_bridge.models.utils import (
+    ModelAttrInfo,
+    extract_metadata,
+    field_flags,
+    merge_field_flags,
+)
 
 if TYPE_CHECKING:
     from type_bridge.crud import RelationManager
@@ -252,23 +257,11 @@ class Relation(TypeDBType, metaclass=RelationMeta):
                             f"Example: {field_name}: list[{field_info.attr_type.__name__}] = Flag(Card(min=1))"
                         )
 
-                    # Merge with cardinality from type annotation if not already set
-                    if flags.card_min is None and flags.card_max is None:
-                        flags.card_min = field_info.card_min
-                        flags.card_max = field_info.card_max
-                    # Set is_key and is_unique from type annotation if found
-                    if field_info.is_key:
-                        flags.is_key = True
-                    if field_info.is_unique:
-                        flags.is_unique = True
+                    # Merge cardinality and key/unique markers from the type annotation
+                    flags = merge_field_flags(flags, field_info)
                 else:
-                    # Create flags from type annotation metadata
-                    flags = AttributeFlags(
-                        is_key=field_info.is_key,
-                        is_unique=field_info.is_unique,
-                        card_min=field_info.card_min,
-                        card_max=field_info.card_max,
-                    )
+                    # Use (shared) flags from type annotation metadata
+                    flags = field_flags(field_info)
 
                 owned_attrs[field_name] = ModelAttrInfo(typ=field_info.attr_type, flags=flags)
 
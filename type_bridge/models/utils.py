@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime as datetime_type
+from functools import cache
 from typing import Literal, get_args, get_origin
 
 from type_bridge.attribute import (
@@ -156,6 +157,60 @@ def extract_metadata(field_type: type) -> FieldInfo:
     return info
 
 
+def field_flags(field_info: FieldInfo) -> AttributeFlags:
+    """Get the AttributeFlags implied by a field's type annotation alone.
+
+    AttributeFlags is immutable, so fields with the same key/unique/cardinality
+    metadata (e.g. every plain ``name: Name`` field) share one instance.
+
+    Args:
+        field_info: Metadata extracted from the field's type annotation
+
+    Returns:
+        Shared AttributeFlags for that metadata combination
+    """
+    return _shared_flags(
+        field_info.is_key, field_info.is_unique, field_info.card_min, field_info.card_max
+    )
+
+
+@cache
+def _shared_flags(
+    is_key: bool, is_unique: bool, card_min: int | None, card_max: int | None
+) -> AttributeFlags:
+    """Build AttributeFlags once per distinct annotation metadata combination."""
+    return AttributeFlags(is_key=is_key, is_unique=is_unique, card_min=card_min, card_max=card_max)
+
+
+def merge_field_flags(flags: AttributeFlags, field_info: FieldInfo) -> AttributeFlags:
+    """Merge type-annotation metadata into flags given as a field default.
+
+    Flag() may hand out shared AttributeFlags instances, so the result is a
+    copy whenever the annotation adds anything; the input is never mutated.
+
+    Args:
+        flags: AttributeFlags from the field's default value (e.g., Flag(Unique))
+        field_info: Metadata extracted from the field's type annotation
+
+    Returns:
+        The input flags if nothing changes, otherwise an updated copy
+    """
+    updates: dict[str, object] = {}
+    # Merge with cardinality from type annotation if not already set
+    if flags.card_min is None and flags.card_max is None:
+        if field_info.card_min is not None or field_info.card_max is not None:
+            updates["card_min"] = field_info.card_min
+            updates["card_max"] = field_info.card_max
+    # Set is_key and is_unique from type annotation if found
+    if field_info.is_key and not flags.is_key:
+        updates["is_key"] = True
+    if field_info.is_unique and not flags.is_unique:
+        updates["is_unique"] = True
+    if not updates:
+        return flags
+    return replace(flags, **updates)
+
+
 def get_base_type_for_attribute(attr_cls: type[Attribute]) -> type | None:
     """Get the base Python type for an Attribute class.
 
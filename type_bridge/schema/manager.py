@@ -1,5 +1,6 @@
 """Schema manager for TypeDB schema operations."""
 
+import hashlib
 import logging
 
 from type_bridge.models import Entity, Relation
@@ -9,6 +10,10 @@ from type_bridge.session import Database
 
 logger = logging.getLogger(__name__)
 
+# Schema last applied by sync_schema, keyed by (address, database name):
+# (hash of the generated TypeQL, schema the server reported right after applying it)
+_applied_schemas: dict[tuple[str, str], tuple[str, str]] = {}
+
 
 class SchemaManager:
     """Manager for database schema operations."""
@@ -163,6 +168,11 @@ class SchemaManager:
 
         Automatically checks for existing schema in the database and raises
         SchemaConflictError if schema already exists and might conflict.
+        If this process already applied the identical schema to the database and
+        the server still reports exactly the schema it had right after that
+        apply, the sync is skipped. Any other schema change (migrations, raw
+        define/undefine, another process) makes the comparison fail, and the
+        usual conflict detection runs.
 
         Args:
             force: If True, recreate database from scratch, ignoring conflicts
@@ -171,6 +181,15 @@ class SchemaManager:
             SchemaConflictError: If database has existing schema and force=False
         """
         logger.info(f"Syncing schema (force={force})")
+        schema = self.generate_schema()
+        schema_key = (self.db.address, self.db.database_name)
+        schema_hash = hashlib.sha256(schema.encode()).hexdigest()
+
+        # Fast exit: the same schema was applied and the server schema is untouched since
+        if not force and self._server_schema_matches(schema_key, schema_hash):
+            logger.info("Schema already up to date, skipping sync")
+            return
+
         # Check for existing schema before making changes
         if not force and self.has_existing_schema():
             logger.debug("Existing schema detected, checking for conflicts")
@@ -213,6 +232,7 @@ class SchemaManager:
         if force:
             # Delete and recreate database
             logger.info("Force mode: recreating database from scratch")
+            _applied_schemas.pop(schema_key, None)
             if self.db.database_exists():
                 logger.debug("Deleting existing database")
                 self.db.delete_database()
@@ -223,15 +243,32 @@ class SchemaManager:
             logger.debug("Creating database")
             self.db.create_database()
 
-        # Generate and apply schema
-        schema = self.generate_schema()
-
+        # Apply schema
         logger.debug("Applying schema to database")
         with self.db.transaction("schema") as tx:
             tx.execute(schema)
             tx.commit()
+        _applied_schemas[schema_key] = (schema_hash, self.db.get_schema())
         logger.info("Schema synchronized successfully")
 
+    def _server_schema_matches(self, schema_key: tuple[str, str], schema_hash: str) -> bool:
+        """Check whether the server still holds the schema this process last applied.
+
+        Args:
+            schema_key: (address, database name) of the target database
+            schema_hash: SHA-256 of the schema about to be applied
+
+        Returns:
+            True if the same schema was applied and the server's schema is unchanged since
+        """
+        applied = _applied_schemas.get(schema_key)
+        if applied is None or applied[0] != schema_hash:
+            return False
+        if not self.db.database_exists():
+            _applied_schemas.pop(schema_key, None)
+            return False
+        return self.db.get_schema() == applied[1]
+
     def _check_schema_conflicts(self) -> str:
         """Check if registered models conflict with existing database schema.
 
@@ -384,6 +421,7 @@ class SchemaManager:
     def drop_schema(self) -> None:
         """Drop all schema definitions."""
         logger.info("Dropping schema")
+        _applied_schemas.pop((self.db.address, self.db.database_name), None)
         if self.db.database_exists():
             self.db.delete_database()
             logger.info("Schema dropped (database deleted)")